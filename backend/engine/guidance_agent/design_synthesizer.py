@@ -88,34 +88,21 @@ class DesignSynthesizer:
                 response = LLM.generate_json(prompt, max_tokens=self.guidance_max_tokens)
                 debug(f"Response for {section_name}: {response}")
                 
-                # Handle case where JSON parsing failed
+                # Handle case where JSON parsing failed (JSON mode only fails on truncated output)
                 if "raw_output" in response:
-                    # Try to parse the raw output
-                    import json
-                    import re
-                    try:
-                        raw_text = response["raw_output"]
-                        # Remove markdown fences if present
-                        if raw_text.startswith("```"):
-                            raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text, flags=re.MULTILINE)
-                            raw_text = re.sub(r"```\s*$", "", raw_text, flags=re.MULTILINE)
-                            raw_text = raw_text.strip()
-                        response = json.loads(raw_text)
-                        debug(f"Successfully parsed raw_output for {section_name}")
-                    except Exception as e:
-                        debug(f"Failed to parse raw_output for {section_name}: {e}")
-                        # Create a fallback structure in canonical format
-                        response = {
-                            "feature": feature_name,
-                            "decision": {"error": "Failed to parse LLM response"},
-                            "alternatives_considered": [],
-                            "justification": {"summary": f"Error processing {section_name}: {str(e)}", "tradeoffs": []},
-                            "limitations": [f"Failed to generate design: {str(e)}"],
-                            "assumptions": [],
-                            "evidence": [],
-                            "risk_assessment": {"risk_level": "high", "primary_risks": ["Parsing failure"], "mitigations": []},
-                            "confidence_score": 0.0
-                        }
+                    debug(f"Failed to parse raw_output for {section_name}")
+                    # Create a fallback structure in canonical format
+                    response = {
+                        "feature": feature_name,
+                        "decision": {"error": "Failed to parse LLM response"},
+                        "alternatives_considered": [],
+                        "justification": {"summary": f"Error processing {section_name}: unparseable LLM output", "tradeoffs": []},
+                        "limitations": ["Failed to generate design: unparseable LLM output"],
+                        "assumptions": [],
+                        "evidence": [],
+                        "risk_assessment": {"risk_level": "high", "primary_risks": ["Parsing failure"], "mitigations": []},
+                        "confidence_score": 0.0
+                    }
                 
                 # Validate the response against canonical schema
                 is_valid, error_msg, validated_response = self.validator.validate(response, feature_name)
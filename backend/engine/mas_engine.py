@@ -1,8 +1,8 @@
-import json
 from backend.engine.requirements_agent.agent import RequirementsAgent
 from backend.engine.requirements_agent.spec_model import SpecificationModel
 from backend.engine.visualization.visualization_manager import VisualizationManager
 from backend.utils.logger import debug
+from backend.utils import fast_json
 import requests
 
 
@@ -33,7 +33,7 @@ class MASAutomationEngine:
         debug(f"\n===== MAS Engine processing message: {message} =====")
 
         before = self.spec.to_dict()
-        debug(f"Spec BEFORE update:\n{json.dumps(before, indent=2)}")
+        debug(lambda: f"Spec BEFORE update:\n{fast_json.dumps(before, indent=True)}")
 
         # ------------------------------------------------------------
         # 1. REQUIREMENTS AGENT — Schema-aware spec update
@@ -44,14 +44,14 @@ class MASAutomationEngine:
             history=history,
         )
 
-        debug(f"RequirementsAgent OUTPUT:\n{json.dumps(agent_output, indent=2)}")
+        debug(lambda: f"RequirementsAgent OUTPUT:\n{fast_json.dumps(agent_output, indent=True)}")
 
         updates = agent_output.get("updated_fields", {})
         if updates:
             self.spec.update(updates)
 
         after = self.spec.to_dict()
-        debug(f"Spec AFTER update:\n{json.dumps(after, indent=2)}")
+        debug(lambda: f"Spec AFTER update:\n{fast_json.dumps(after, indent=True)}")
 
         # ------------------------------------------------------------
         # 2. VISUALIZATION PIPELINE — Convert spec → IR → graph
@@ -19,10 +19,52 @@ from backend.engine.requirements_agent.assumption_strategies import (
 from backend.engine.requirements_agent.prompt_builder import PromptBuilder
 from backend.engine.requirements_agent.schema_formatter import SchemaFormatter
 from backend.engine.requirements_agent.field_validator import FieldValidator
+from backend.engine.requirements_agent.history_summarizer import HistorySummarizer
+from backend.engine.requirements_agent.interfaces import IHistorySummarizer
+from backend.engine.requirements_agent.spec_schema import SPEC_SCHEMA
 from backend.llm.llm_manager import LLM
 from backend.utils.logger import debug
 
 
+# Messages that carry no information; answered locally without calling the LLM.
+# Acknowledgements ("ok", "yes", "no") are excluded since they may accept a
+# value the assistant just proposed.
+_NO_CONTENT_MESSAGES = frozenset({"", "hi", "hello", "hey"})
+
+_JSON_TYPES = {
+    "string": "string",
+    "integer": "integer",
+    "boolean": "boolean",
+    "list": "array",
+    "dict": "object",
+}
+
+
+def _build_response_schema() -> Dict[str, Any]:
+    """JSON Schema for the LLM reply, with updated_fields derived from SPEC_SCHEMA."""
+    field_props = {
+        name: {"type": _JSON_TYPES.get(meta.get("type"), "string")}
+        for name, meta in SPEC_SCHEMA.items()
+    }
+    return {
+        "type": "object",
+        "properties": {
+            "updated_fields": {
+                "type": "object",
+                "properties": field_props,
+                "additionalProperties": False,
+            },
+            "reply": {"type": "string"},
+            "follow_up_question": {"type": "string"},
+        },
+        "required": ["updated_fields", "reply", "follow_up_question"],
+        "additionalProperties": False,
+    }
+
+
+_RESPONSE_SCHEMA = _build_response_schema()
+
+
 class RequirementsAgent:
     """
     Requirements collection agent that orchestrates the conversation.
@@ -39,6 +81,7 @@ class RequirementsAgent:
         assumption_engine: Optional[AssumptionEngine] = None,
         prompt_builder: Optional[PromptBuilder] = None,
         field_validator: Optional[FieldValidator] = None,
+        history_summarizer: Optional[IHistorySummarizer] = None,
     ):
         """
         Initialize with dependency injection.
@@ -68,6 +111,9 @@ class RequirementsAgent:
         else:
             self._prompt_builder = prompt_builder
 
+        # Initialize rolling summary of older conversation turns
+        self._history_summarizer = history_summarizer or HistorySummarizer()
+
     # =====================================================================
     # PUBLIC ENTRY POINT
     # =====================================================================
@@ -84,12 +130,16 @@ class RequirementsAgent:
         debug("RequirementsAgent.run() called")
         debug(f"User message: {user_message}")
 
+        # Summarize this history in the background; next turn's prompt uses it
+        history_summary, prompt_history = self._history_summarizer.split_history(history)
+        self._history_summarizer.refresh_async(history)
+
         # Normalize spec -> model
         spec_model = self._build_spec_model(current_spec)
         spec_dict = spec_model.to_dict()
         missing_required = spec_model.missing_required_fields()
 
-        debug(f"Current spec:\n{spec_dict}")
+        debug(lambda: f"Current spec:\n{spec_dict}")
         debug(f"Missing required fields: {missing_required}")
 
         # Determine what to ask/suggest next
@@ -109,37 +159,38 @@ class RequirementsAgent:
             spec_model.update(assumed_updates)
             spec_dict = spec_model.to_dict()
 
-        # Build conversation-focused prompt
+        # Fast path: nothing to extract, so just ask for the next required field
+        if missing_required and user_message.strip().lower() in _NO_CONTENT_MESSAGES:
+            return self._ask_next_required(next_field or missing_required[0], assumed_updates)
+
+        # Build conversation-focused prompt (static system prefix + per-turn tail)
+        system_prompt = self._prompt_builder.build_system_prompt()
         prompt = self._prompt_builder.build_prompt(
-            user_message, spec_dict, history, missing_required, next_field
+            user_message, spec_dict, prompt_history, missing_required, next_field,
+            history_summary=history_summary,
         )
-        debug(f"RequirementsAgent prompt:\n{prompt}")
+        debug(lambda: f"RequirementsAgent prompt:\n{prompt}")
 
         # Call LLM
-        llm_output = LLM.generate_json(prompt)
-        debug(f"Raw LLM JSON output: {llm_output}")
+        llm_output = LLM.generate_json(
+            prompt,
+            system=system_prompt,
+            schema=_RESPONSE_SCHEMA,
+            schema_name="requirements_agent_response",
+        )
+        debug(lambda: f"Raw LLM JSON output: {llm_output}")
 
-        # Handle case where JSON parsing failed and raw_output is returned
+        # JSON mode guarantees valid JSON unless the output was truncated
         if "raw_output" in llm_output:
-            # Try to parse the raw output as JSON
-            import json
-            import re
-            try:
-                raw_text = llm_output["raw_output"]
-                # Remove markdown fences if present
-                if raw_text.startswith("```"):
-                    raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text, flags=re.MULTILINE)
-                    raw_text = re.sub(r"```\s*$", "", raw_text, flags=re.MULTILINE)
-                    raw_text = raw_text.strip()
-                # Try to extract JSON from the raw text
-                llm_output = json.loads(raw_text)
-                debug(f"Successfully parsed raw_output: {llm_output}")
-            except Exception as e:
-                debug(f"Failed to parse raw_output: {e}, raw_text: {llm_output.get('raw_output', '')[:200]}")
-                # Fallback: return empty updates
-                llm_output = {}
+            debug(f"Unparseable LLM output, ignoring: {llm_output['raw_output'][:200]}")
+            llm_output = {}
 
         updated_fields = llm_output.get("updated_fields", {}) or {}
+        # A null value is not an update; drop it so it can't clear or corrupt a field
+        if isinstance(updated_fields, dict):
+            updated_fields = {k: v for k, v in updated_fields.items() if v is not None}
+        else:
+            updated_fields = {}
         reply = llm_output.get("reply")
         follow_up = llm_output.get("follow_up_question")
 
@@ -173,6 +224,19 @@ class RequirementsAgent:
     # INTERNAL HELPERS
     # =====================================================================
 
+    def _ask_next_required(
+        self, field_name: str, assumed_updates: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build a deterministic reply asking for a required field, skipping the LLM."""
+        ask = SPEC_SCHEMA.get(field_name, {}).get("ask_user", f"What should the {field_name} be?")
+        reply = f"Next, could you tell me: {ask}"
+        debug(f"Skipping LLM for no-content message, asking about: {field_name}")
+        return {
+            "reply": reply,
+            "updated_fields": self._field_validator.clean_updates(assumed_updates or {}),
+            "needs_more": True,
+        }
+
     def _build_spec_model(self, current_spec: Any) -> SpecificationModel:
         """Build a SpecificationModel from various input types."""
         model = SpecificationModel()
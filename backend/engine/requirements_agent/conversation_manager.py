@@ -9,6 +9,19 @@ from backend.engine.requirements_agent.spec_schema import SPEC_SCHEMA
 from backend.engine.requirements_agent.field_validator import FieldValidator
 
 
+# Optional fields that can be assumed, but only once agents are defined
+_AGENT_DEPENDENT_FIELDS = frozenset({"communication", "topology", "memory", "planning"})
+
+# SPEC_SCHEMA is static, so the assumable candidates are resolved once (in schema order)
+_ASSUMABLE_FIELDS = tuple(
+    field_name
+    for field_name, meta in SPEC_SCHEMA.items()
+    if not meta.get("required")
+    and meta.get("can_assume", False)
+    and field_name in _AGENT_DEPENDENT_FIELDS
+)
+
+
 class ConversationManager(IConversationManager):
     """
     Manages conversation flow and question prioritization.
@@ -49,25 +62,12 @@ class ConversationManager(IConversationManager):
         """
         Get list of fields that can be assumed given current spec.
         """
-        assumable_fields = []
-        for field_name, meta in SPEC_SCHEMA.items():
-            if not meta.get("required"):
-                current_value = spec.get(field_name)
-                # Check if field is empty and can be assumed
-                if (self._field_validator.is_empty(current_value) and 
-                    meta.get("can_assume", False)):
-                    # Check if we have enough context to assume it
-                    if self._can_assume_field(field_name, spec):
-                        assumable_fields.append(field_name)
-        
-        return assumable_fields
-    
-    def _can_assume_field(self, field_name: str, spec: Dict[str, Any]) -> bool:
-        """
-        Check if we have enough context to make an assumption about a field.
-        """
-        # We can assume fields if we have agents defined
-        if field_name in ["communication", "topology", "memory", "planning"]:
-            return bool(spec.get("agents"))
-        return False
-
+        # We can only assume fields if we have agents defined
+        if not spec.get("agents"):
+            return []
+        is_empty = self._field_validator.is_empty
+        return [
+            field_name
+            for field_name in _ASSUMABLE_FIELDS
+            if is_empty(spec.get(field_name))
+        ]
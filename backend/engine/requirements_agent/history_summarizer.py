@@ -0,0 +1,100 @@
+"""
+Rolling conversation summary.
+Single Responsibility: Condenses older conversation turns into one line.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from backend.engine.requirements_agent.interfaces import IHistorySummarizer
+from backend.llm.llm_manager import LLM
+from backend.utils.logger import debug
+
+
+class HistorySummarizer(IHistorySummarizer):
+    """
+    Maintains a one-line summary of the conversation outside the recent window.
+    Summaries are refreshed in the background and cached by history content,
+    so building a prompt never waits on the LLM.
+    """
+
+    def __init__(self, keep_recent: int = 2, max_entries: int = 128):
+        self._keep_recent = keep_recent
+        self._max_entries = max_entries
+        self._summaries: "OrderedDict[int, str]" = OrderedDict()
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def split_history(
+        self, history: List[Dict[str, str]]
+    ) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """
+        Split history into (summary of older turns, messages it does not cover).
+        Without an available summary, the full history is returned unchanged.
+        """
+        summary = self._lookup(history)
+        if summary is None:
+            return None, history
+        return summary, history[self._split_index(history):]
+
+    def _lookup(self, history: List[Dict[str, str]]) -> Optional[str]:
+        """Summary of everything before the recent window, if already available."""
+        older = history[:self._split_index(history)]
+        if not older:
+            return None
+        with self._lock:
+            return self._summaries.get(self._key(older))
+
+    def refresh_async(self, history: List[Dict[str, str]]) -> None:
+        """
+        Start summarizing the given history in a background thread.
+        On the next turn these messages fall outside the recent window,
+        and their summary is looked up under the same key.
+        """
+        if len(history) <= self._keep_recent:
+            return
+        key = self._key(history)
+        with self._lock:
+            if key in self._summaries or key in self._in_flight:
+                return
+            self._in_flight.add(key)
+        threading.Thread(
+            target=self._summarize,
+            args=(key, list(history)),
+            name="history-summarizer",
+            daemon=True,
+        ).start()
+
+    def _summarize(self, key: int, history: List[Dict[str, str]]) -> None:
+        try:
+            # Fold the newest turns into the previous summary to keep the prompt small
+            previous = self._lookup(history)
+            recent = history[self._split_index(history):] if previous else history
+            lines = "\n".join(
+                f"{'User' if m['role'] == 'user' else 'Assistant'}: {m['content']}"
+                for m in recent
+            )
+            prompt = (
+                "Summarize this conversation about designing a multi-agent system "
+                "in one line, keeping every concrete requirement the user stated.\n"
+                + (f"Summary so far: {previous}\n" if previous else "")
+                + f"Messages:\n{lines}"
+            )
+            summary = LLM.generate(prompt, max_tokens=120)
+            with self._lock:
+                self._summaries[key] = summary
+                while len(self._summaries) > self._max_entries:
+                    self._summaries.popitem(last=False)
+        except Exception as e:
+            debug(f"History summary failed: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def _split_index(self, history: List[Dict[str, str]]) -> int:
+        """Index where the verbatim recent window starts."""
+        return max(0, len(history) - self._keep_recent)
+
+    @staticmethod
+    def _key(history: List[Dict[str, str]]) -> int:
+        return hash(tuple(m["content"] for m in history))
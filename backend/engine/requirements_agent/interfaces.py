@@ -3,7 +3,7 @@ Interfaces and abstract classes for requirements agent components.
 Follows Dependency Inversion Principle - depend on abstractions, not concretions.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class IAssumptionStrategy(ABC):
@@ -47,6 +47,11 @@ class IConversationManager(ABC):
 class IPromptBuilder(ABC):
     """Interface for building prompts for LLM."""
     
+    @abstractmethod
+    def build_system_prompt(self) -> str:
+        """Build the static system prompt shared by every turn."""
+        pass
+    
     @abstractmethod
     def build_prompt(
         self,
@@ -55,8 +60,12 @@ class IPromptBuilder(ABC):
         history: List[Dict[str, str]],
         missing_required: List[str],
         next_field: Optional[str],
+        history_summary: Optional[str] = None,
     ) -> str:
-        """Build a prompt for the LLM."""
+        """
+        Build a prompt for the LLM.
+        When history_summary is given, history holds only the messages it does not cover.
+        """
         pass
 
 
@@ -87,3 +96,18 @@ class IFieldValidator(ABC):
         """Clean and validate updates, keeping only valid schema fields."""
         pass
 
+
+class IHistorySummarizer(ABC):
+    """Interface for condensing older conversation turns."""
+    
+    @abstractmethod
+    def split_history(
+        self, history: List[Dict[str, str]]
+    ) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """Get (summary of older turns, messages not covered by it)."""
+        pass
+    
+    @abstractmethod
+    def refresh_async(self, history: List[Dict[str, str]]) -> None:
+        """Start refreshing the summary for the given history in the background."""
+        pass
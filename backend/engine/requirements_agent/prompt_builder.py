@@ -2,11 +2,22 @@
 Prompt builder for LLM interactions.
 Single Responsibility: Constructs prompts for the LLM.
 """
-import json
 from typing import Any, Dict, List, Optional
 
 from backend.engine.requirements_agent.interfaces import IPromptBuilder, ISchemaFormatter
 from backend.engine.requirements_agent.spec_schema import SPEC_SCHEMA
+from backend.utils import fast_json
+
+
+# Static pieces of the per-turn prompt, built once and joined with the dynamic parts
+_RULE = "=" * 51
+_SPEC_HEADER = f"{_RULE}\nCURRENT SPECIFICATION:\n{_RULE}\n"
+_HISTORY_HEADER = f"\n{_RULE}\nCONVERSATION HISTORY:\n{_RULE}\n"
+_USER_MESSAGE_HEADER = f"\n\n{_RULE}\nUSER'S MESSAGE:\n{_RULE}\n"
+_RESPONSE_FOOTER = (
+    f"\n\n{_RULE}\nYOUR RESPONSE:\n{_RULE}\n"
+    "Respond with ONLY valid JSON in the OUTPUT FORMAT described above."
+)
 
 
 class PromptBuilder(IPromptBuilder):
@@ -18,25 +29,16 @@ class PromptBuilder(IPromptBuilder):
     
     def __init__(self, schema_formatter: ISchemaFormatter):
         self._schema_formatter = schema_formatter
+        self._system_prompt: Optional[str] = None
     
-    def build_prompt(
-        self,
-        user_message: str,
-        spec_dict: Dict[str, Any],
-        history: List[Dict[str, str]],
-        missing_required: List[str],
-        next_field: Optional[str],
-    ) -> str:
-        """Build a conversation-focused prompt for the LLM."""
-        # Build history snippet
-        history_text = self._build_history_text(history)
-        
-        schema_text = self._schema_formatter.format_schema()
-        
-        # Build context about what to focus on
-        focus_text = self._build_focus_text(missing_required, next_field)
-
-        return f"""
+    def build_system_prompt(self) -> str:
+        """
+        Build the static instructions, schema and output format.
+        Identical on every turn so the provider can reuse its cached prefix.
+        """
+        if self._system_prompt is None:
+            schema_text = self._schema_formatter.format_schema()
+            self._system_prompt = f"""
 You are a friendly assistant helping someone build a multi-agent system. Your job is to:
 1. Understand what they want in plain language
 2. Ask ONE clear question at a time (no technical jargon)
@@ -58,23 +60,7 @@ SCHEMA (what information to collect):
 {schema_text}
 
 ===================================================
-CURRENT SPECIFICATION:
-===================================================
-{json.dumps(spec_dict, indent=2)}
-
-{focus_text}
-===================================================
-CONVERSATION HISTORY:
-===================================================
-{history_text}
-
-===================================================
-USER'S MESSAGE:
-===================================================
-{user_message}
-
-===================================================
-YOUR RESPONSE:
+OUTPUT FORMAT:
 ===================================================
 You must respond with ONLY valid JSON in this format:
 {{
@@ -96,15 +82,55 @@ Remember:
 - Use plain language - explain things simply
 - If you made assumptions, tell the user what you assumed
 """.strip()
+        return self._system_prompt
+
+    def build_prompt(
+        self,
+        user_message: str,
+        spec_dict: Dict[str, Any],
+        history: List[Dict[str, str]],
+        missing_required: List[str],
+        next_field: Optional[str],
+        history_summary: Optional[str] = None,
+    ) -> str:
+        """Build the per-turn part of the prompt (sent after the system prompt)."""
+        # Build history snippet
+        history_text = self._build_history_text(history, history_summary)
+        
+        # Build context about what to focus on
+        focus_text = self._build_focus_text(missing_required, next_field)
+
+        return "".join((
+            _SPEC_HEADER,
+            fast_json.dumps(spec_dict),
+            "\n\n",
+            focus_text,
+            _HISTORY_HEADER,
+            history_text,
+            _USER_MESSAGE_HEADER,
+            user_message,
+            _RESPONSE_FOOTER,
+        ))
     
-    def _build_history_text(self, history: List[Dict[str, str]]) -> str:
+    def _build_history_text(
+        self,
+        history: List[Dict[str, str]],
+        history_summary: Optional[str] = None,
+    ) -> str:
         """Build conversation history text."""
         if history:
-            history_text = "Recent conversation:\n"
-            for msg in history[-8:]:  # Last 8 messages for context
+            parts = []
+            # With a summary, history is already just the messages it does not cover
+            if history_summary:
+                parts.append(f"Summary of earlier conversation: {history_summary}\n")
+                recent = history
+            else:
+                recent = history[-8:]  # Last 8 messages for context
+            parts.append("Recent conversation:\n")
+            for msg in recent:
                 role = "User" if msg["role"] == "user" else "You"
-                history_text += f"{role}: {msg['content']}\n"
-            return history_text
+                parts.append(f"{role}: {msg['content']}\n")
+            return "".join(parts)
         else:
             return "This is the start of the conversation.\n"
     
@@ -3,7 +3,7 @@ Schema formatting for LLM consumption.
 Single Responsibility: Formats schema information in user-friendly way.
 """
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from backend.engine.requirements_agent.interfaces import ISchemaFormatter
 from backend.engine.requirements_agent.spec_schema import SPEC_SCHEMA
@@ -15,6 +15,10 @@ class SchemaFormatter(ISchemaFormatter):
     Follows Single Responsibility Principle.
     """
     
+    def __init__(self):
+        # SPEC_SCHEMA is static, so the formatted text is built once per formatter
+        self._schema_text: Optional[str] = None
+    
     def format_field(self, name: str, meta: Dict[str, Any]) -> str:
         """Generate a user-friendly description of a schema field for the LLM."""
         required = "REQUIRED" if meta.get("required") else "optional"
@@ -68,10 +72,12 @@ class SchemaFormatter(ISchemaFormatter):
     
     def format_schema(self) -> str:
         """Generate schema summary sorted by conversation priority."""
-        fields = list(SPEC_SCHEMA.items())
-        fields.sort(key=lambda x: x[1].get("conversation_priority", 999))
-        return "\n\n".join(
-            self.format_field(name, meta)
-            for name, meta in fields
-        )
+        if self._schema_text is None:
+            fields = list(SPEC_SCHEMA.items())
+            fields.sort(key=lambda x: x[1].get("conversation_priority", 999))
+            self._schema_text = "\n\n".join(
+                self.format_field(name, meta)
+                for name, meta in fields
+            )
+        return self._schema_text
 
@@ -1,10 +1,17 @@
 # backend/llm/llm_manager.py
 
 import os
+import asyncio
+import atexit
+import copy
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
-import re
-import json
+from openai import OpenAI, AsyncOpenAI
+from backend.utils import fast_json
 
 # ---------------------------------------------------------
 # LOAD ENVIRONMENT AND GLOBAL LLM CONFIG
@@ -17,8 +24,223 @@ API_KEY = os.getenv("OPENAI_API_KEY")
 if not API_KEY:
     raise RuntimeError("OPENAI_API_KEY is missing in .env")
 
-# Create a global client instance
-_global_client = OpenAI(api_key=API_KEY)
+# Shared HTTP connection pools; HTTP/2 multiplexes concurrent calls over one
+# connection when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_http_client = httpx.Client(http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+_async_http_client = httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+atexit.register(_http_client.close)
+
+# Create global client instances (sync for direct calls, async for batching)
+_global_client = OpenAI(api_key=API_KEY, http_client=_http_client)
+_global_async_client = AsyncOpenAI(api_key=API_KEY, http_client=_async_http_client)
+
+# Calls arriving within this window are dispatched together (0 disables batching)
+BATCH_WINDOW_MS = float(os.getenv("LLM_BATCH_WINDOW_MS", "20"))
+BATCH_MAX_SIZE = int(os.getenv("LLM_BATCH_MAX_SIZE", "16"))
+
+# ---------------------------------------------------------
+# CLIENT-SIDE RESPONSE CACHE (parsed generate_json results)
+# ---------------------------------------------------------
+CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "256"))
+# Sampling above this temperature is too random for a cached answer to be reused
+CACHE_MAX_TEMPERATURE = 0.2
+
+_response_cache: "OrderedDict[str, dict]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _cache_key(prompt: str, system: str, max_tokens: int, schema: dict = None) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update((system or "").encode("utf-8"))
+    h.update(b"\0")
+    h.update(prompt.encode("utf-8"))
+    if schema is not None:
+        # Different response schemas must never share a cached answer
+        h.update(b"\0")
+        h.update(fast_json.dumps(schema).encode("utf-8"))
+    digest = h.hexdigest()
+    return f"{digest}:{LLM.model}:{LLM.temperature}:{max_tokens}"
+
+
+def _request_key(prompt: str, system: str, overrides: dict) -> str:
+    """Identity of a generate() request, including every per-call override."""
+    params = repr(sorted(overrides.items())).encode("utf-8")
+    h = hashlib.blake2b(params, digest_size=8)
+    return f"{_cache_key(prompt, system, LLM.max_tokens)}:{h.hexdigest()}"
+
+
+def _build_messages(prompt: str, system: str = None) -> list:
+    messages = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _request_kwargs(prompt, system, max_tokens, temperature, response_format) -> dict:
+    kwargs = {
+        "model": LLM.model,
+        "messages": _build_messages(prompt, system),
+        "max_tokens": max_tokens if max_tokens is not None else LLM.max_tokens,
+        "temperature": temperature if temperature is not None else LLM.temperature,
+    }
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    return kwargs
+
+
+class _JsonObjectScanner:
+    """
+    Tracks brace depth across streamed chunks to find where the top-level
+    JSON object closes. Braces inside string literals are ignored.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> int:
+        """Return the index just past the closing brace in `text`, or -1."""
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = self._started
+            elif ch == "{":
+                self._depth += 1
+                self._started = True
+            elif ch == "}" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return i + 1
+        return -1
+
+
+def _chunk_text(chunk) -> str:
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
+
+
+# ---------------------------------------------------------
+# MICRO-BATCHING DISPATCHER
+# ---------------------------------------------------------
+class _BatchDispatcher:
+    """
+    Coalesces generate() calls from concurrent threads and sends them
+    together on a background event loop via the async client.
+
+    Calls are grouped per prompt-length bucket; a bucket is flushed when its
+    window expires or it reaches the maximum batch size, and all requests in
+    it are issued concurrently with asyncio.gather.
+
+    Identical low-temperature requests that are already in flight are not sent
+    again; later callers wait on the first caller's result (single-flight).
+    """
+
+    def __init__(self, window_s: float, max_batch: int):
+        self._window_s = window_s
+        self._max_batch = max(1, max_batch)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        # Only touched from the dispatcher loop thread
+        self._pending = {}
+        self._timers = {}
+        self._in_flight = {}
+        # Strong references so dispatch tasks aren't garbage-collected mid-run
+        self._tasks = set()
+
+    def submit(self, prompt: str, system: str = None, **overrides) -> str:
+        """Blocking shim for synchronous callers."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._enqueue(prompt, system, overrides), loop
+        )
+        return future.result()
+
+    def _ensure_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-batch-dispatcher",
+                    daemon=True,
+                ).start()
+            return self._loop
+
+    async def _enqueue(self, prompt: str, system: str, overrides: dict) -> str:
+        loop = asyncio.get_running_loop()
+
+        temperature = overrides.get("temperature")
+        if temperature is None:
+            temperature = LLM.temperature
+        key = None
+        if temperature <= CACHE_MAX_TEMPERATURE:
+            key = _request_key(prompt, system, overrides)
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                return await asyncio.shield(in_flight)
+
+        # Similar-length prompts finish at similar times, so batch them together
+        bucket = (len(prompt) + len(system or "")).bit_length()
+        future = loop.create_future()
+        if key is not None:
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        batch = self._pending.setdefault(bucket, [])
+        batch.append((prompt, system, overrides, future))
+        if len(batch) >= self._max_batch:
+            self._flush(bucket)
+        elif bucket not in self._timers:
+            self._timers[bucket] = loop.call_later(self._window_s, self._flush, bucket)
+
+        return await asyncio.shield(future)
+
+    def _flush(self, bucket: int):
+        timer = self._timers.pop(bucket, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(bucket, None)
+        if batch:
+            task = self._loop.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list):
+        results = await asyncio.gather(
+            *(
+                LLM.generate_async(prompt, system=system, **overrides)
+                for prompt, system, overrides, _ in batch
+            ),
+            return_exceptions=True,
+        )
+        for (*_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_dispatcher = (
+    _BatchDispatcher(BATCH_WINDOW_MS / 1000.0, BATCH_MAX_SIZE)
+    if BATCH_WINDOW_MS > 0
+    else None
+)
 
 
 class LLM:
@@ -42,81 +264,173 @@ class LLM:
         if max_tokens is not None:
             LLM.max_tokens = max_tokens
 
+    @staticmethod
+    def cache_clear():
+        """Drop every cached generate_json response."""
+        with _response_cache_lock:
+            _response_cache.clear()
+
     # ---------------------------------------------------------
     # BASIC GENERATION
     # ---------------------------------------------------------
     @staticmethod
-    def generate(prompt: str) -> str:
+    def generate(
+        prompt: str,
+        system: str = None,
+        max_tokens: int = None,
+        temperature: float = None,
+        response_format: dict = None,
+        stop_at_json_end: bool = False,
+    ) -> str:
         """
-        Simple prompt → text completion using OpenAI Responses API.
+        Simple prompt → text completion using OpenAI Chat Completions API.
+
+        Static instructions should be passed as `system` so they form a stable
+        message prefix that OpenAI's automatic prompt caching can reuse.
+        Concurrent calls are coalesced by the batch dispatcher when enabled.
+        max_tokens / temperature override the class defaults for this call only.
+        With stop_at_json_end, the output is streamed and the stream is closed
+        as soon as the top-level JSON object is complete.
         """
-        response = _global_client.responses.create(
-            model=LLM.model,
-            input=prompt,
-            max_output_tokens=LLM.max_tokens,
-            temperature=LLM.temperature,
-        )
-        return response.output_text.strip()
+        if _dispatcher is not None:
+            return _dispatcher.submit(
+                prompt,
+                system,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
+                stop_at_json_end=stop_at_json_end,
+            )
+
+        kwargs = _request_kwargs(prompt, system, max_tokens, temperature, response_format)
+        if not stop_at_json_end:
+            response = _global_client.chat.completions.create(**kwargs)
+            return (response.choices[0].message.content or "").strip()
+
+        scanner = _JsonObjectScanner()
+        parts = []
+        stream = _global_client.chat.completions.create(stream=True, **kwargs)
+        try:
+            for chunk in stream:
+                text = _chunk_text(chunk)
+                end = scanner.feed(text)
+                if end != -1:
+                    parts.append(text[:end])
+                    break
+                parts.append(text)
+        finally:
+            stream.close()
+        return "".join(parts).strip()
+
+    @staticmethod
+    async def generate_async(
+        prompt: str,
+        system: str = None,
+        max_tokens: int = None,
+        temperature: float = None,
+        response_format: dict = None,
+        stop_at_json_end: bool = False,
+    ) -> str:
+        """
+        Async prompt → text completion using the AsyncOpenAI client.
+        """
+        kwargs = _request_kwargs(prompt, system, max_tokens, temperature, response_format)
+        if not stop_at_json_end:
+            response = await _global_async_client.chat.completions.create(**kwargs)
+            return (response.choices[0].message.content or "").strip()
+
+        scanner = _JsonObjectScanner()
+        parts = []
+        stream = await _global_async_client.chat.completions.create(stream=True, **kwargs)
+        try:
+            async for chunk in stream:
+                text = _chunk_text(chunk)
+                end = scanner.feed(text)
+                if end != -1:
+                    parts.append(text[:end])
+                    break
+                parts.append(text)
+        finally:
+            await stream.close()
+        return "".join(parts).strip()
 
     # ---------------------------------------------------------
     # JSON OUTPUT UTILITY
     # ---------------------------------------------------------
     @staticmethod
-    def generate_json(prompt: str, max_tokens: int = None) -> dict:
+    def generate_json(
+        prompt: str,
+        max_tokens: int = None,
+        system: str = None,
+        schema: dict = None,
+        schema_name: str = "response",
+    ) -> dict:
         """
-        Prompts the model and tries to parse the output as JSON.
-        Automatically strips markdown fences like ```json and ```.
+        Prompts the model in JSON mode and parses the output.
+        The API guarantees a JSON object (or one matching `schema` when given),
+        so no markdown fence stripping or repair is needed. The response is
+        streamed and cut off once the JSON object closes.
+        Identical prompts are answered from an in-process LRU cache when the
+        configured temperature is low enough for the output to be reusable.
 
         Args:
             prompt: The prompt to send to the LLM
             max_tokens: Optional max tokens override. If None, uses LLM.max_tokens
+            system: Optional static system prompt sent ahead of the prompt
+            schema: Optional JSON Schema the response should follow
+            schema_name: Name reported to the API for `schema`
 
         Returns:
             dict: Parsed JSON object
-                  or {"raw_output": "..."} on failure
+                  or {"raw_output": "..."} on failure (e.g. output cut off at max_tokens)
         """
         # Use provided max_tokens or fall back to class default
         tokens_to_use = max_tokens if max_tokens is not None else LLM.max_tokens
-        
-        # Temporarily override max_tokens if needed
-        original_max_tokens = LLM.max_tokens
-        if max_tokens is not None:
-            LLM.max_tokens = max_tokens
-        
-        try:
-            raw = LLM.generate(prompt).strip()
-        finally:
-            # Restore original max_tokens
-            if max_tokens is not None:
-                LLM.max_tokens = original_max_tokens
 
-        # ---------------------------------------------------------
-        # Remove Markdown fences: ```json ... ``` or ``` ... ```
-        # ---------------------------------------------------------
-        # Remove opening ```json or ```
-        if raw.startswith("```"):
-            raw = raw.lstrip("`")
-            raw = raw.replace("json", "", 1).strip()
+        key = None
+        if CACHE_SIZE > 0 and LLM.temperature <= CACHE_MAX_TEMPERATURE:
+            key = _cache_key(prompt, system, tokens_to_use, schema)
+            with _response_cache_lock:
+                cached = _response_cache.get(key)
+                if cached is not None:
+                    _response_cache.move_to_end(key)
+                    return copy.deepcopy(cached)
 
-        # Remove trailing ```
-        if raw.endswith("```"):
-            raw = raw[:-3].strip()
+        if schema is not None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": schema_name, "schema": schema, "strict": False},
+            }
+        else:
+            response_format = {"type": "json_object"}
 
-        # Also handle multi-line fenced blocks
-        import re
-        fenced = re.findall(r"```(?:json)?(.*?)```", raw, re.DOTALL)
-        if fenced:
-            raw = fenced[0].strip()
+        raw = LLM.generate(
+            prompt,
+            system=system,
+            max_tokens=tokens_to_use,
+            response_format=response_format,
+            stop_at_json_end=True,
+        ).strip()
 
         # ---------------------------------------------------------
         # Attempt JSON parsing
         # ---------------------------------------------------------
         try:
-            return json.loads(raw)
+            parsed = fast_json.loads(raw)
         except Exception:
             # Return raw output for debugging
             return {"raw_output": raw}
 
+        # Only successfully parsed dicts are cached; callers get their own copy
+        if key is not None and isinstance(parsed, dict):
+            with _response_cache_lock:
+                _response_cache[key] = copy.deepcopy(parsed)
+                _response_cache.move_to_end(key)
+                while len(_response_cache) > CACHE_SIZE:
+                    _response_cache.popitem(last=False)
+
+        return parsed
+
 
     # ---------------------------------------------------------
     # CHAT-STYLE INTERFACE (future ready)
@@ -0,0 +1,29 @@
+"""
+JSON helpers for hot paths.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize to a str; compact by default, two-space indented if requested."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data):
+    """Parse a JSON str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,2 +1,13 @@
+import os
+
+# Set ORCA_DEBUG=0 to silence debug output
+DEBUG_ENABLED = os.getenv("ORCA_DEBUG", "1").strip().lower() not in ("0", "false", "no")
+
+
 def debug(msg):
+    """Print a debug message. Pass a callable to defer building costly messages."""
+    if not DEBUG_ENABLED:
+        return
+    if callable(msg):
+        msg = msg()
     print(f"\n===== DEBUG: {msg} =====\n")